@@ -0,0 +1,134 @@
+import io
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass, field
+
+from src.epub_file_downloader.epub_file_downloader import (
+    EpubFileDownloader,
+    FileOutcome,
+)
+from src.epub_locator.epub_locator import EpubLocator
+from src.file_manager.file_manager import FileManager
+from src.image_optimizer.image_optimizer import ImageOptimizer
+from src.logster.logster import Logster
+from src.profiler.profiler import Profiler
+
+SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+
+@dataclass
+class EpubDownloadResult:
+    ebook_name: str = None
+    base_url: str = None
+    output_path: str = None
+    content: bytes = None
+    total_time: float = 0.0
+    timings: dict[str, float] = field(default_factory=dict)
+    files: list[FileOutcome] = field(default_factory=list)
+    images_bytes_saved: int = None
+
+    @property
+    def failed_files(self) -> list[FileOutcome]:
+        return [outcome for outcome in self.files if not outcome.success]
+
+
+class EpubDownloadError(RuntimeError):
+    def __init__(self, message: str, result: EpubDownloadResult):
+        super().__init__(message)
+        self.result: EpubDownloadResult = result
+
+
+def is_seekable(stream) -> bool:
+    seekable = getattr(stream, "seekable", None)
+    return seekable is not None and seekable()
+
+
+def resolve_output_path(output, ebook_name: str) -> str:
+    path: str = os.fspath(output)
+    if path.endswith(".epub") and not os.path.isdir(path):
+        return path
+    return os.path.join(path, f"{ebook_name}.epub")
+
+
+def download_epub(
+    url: str,
+    output=None,
+    logster: Logster = None,
+    profiler: Profiler = None,
+    image_optimizer: ImageOptimizer = None,
+    show_progress: bool = False,
+) -> EpubDownloadResult:
+    logster = logster or Logster(verbose=False, quiet=True)
+    profiler = profiler or Profiler(logster, enabled=False)
+    start: float = time.perf_counter()
+
+    result = EpubDownloadResult()
+    try:
+        with profiler.phase("locate epub"):
+            locator = EpubLocator(logster, url.rstrip("/"))
+            base_url: str = locator.get_epub_base_url()
+            ebook_name: str = locator.get_ebook_name()
+    except Exception as e:
+        result.timings = dict(profiler.phase_timings)
+        result.total_time = time.perf_counter() - start
+        raise EpubDownloadError(str(e), result) from e
+
+    result.ebook_name = ebook_name
+    result.base_url = base_url
+    spool = None
+    if output is None:
+        epub_target = io.BytesIO()
+    elif isinstance(output, (str, os.PathLike)):
+        epub_target = resolve_output_path(output, ebook_name)
+        result.output_path = epub_target
+    elif is_seekable(output):
+        epub_target = output
+    else:
+        # ZipFile writes data descriptors on unseekable streams, which
+        # streaming readers reject for stored entries such as mimetype.
+        spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        epub_target = spool
+
+    with tempfile.TemporaryDirectory(prefix="epub_downloader_") as staging_dir:
+        file_manager = FileManager(
+            logster, ebook_name, output_dir=staging_dir, epub_target=epub_target
+        )
+        downloader = EpubFileDownloader(
+            logster,
+            base_url,
+            ebook_name,
+            profiler,
+            image_optimizer,
+            file_manager=file_manager,
+            show_progress=show_progress,
+        )
+        try:
+            downloader.download_epub_files()
+            if spool is not None:
+                spool.seek(0)
+                shutil.copyfileobj(spool, output)
+        except Exception as e:
+            collect_download_stats(result, downloader, profiler, start)
+            raise EpubDownloadError(str(e), result) from e
+        finally:
+            if spool is not None:
+                spool.close()
+
+    if output is None:
+        result.content = epub_target.getvalue()
+    collect_download_stats(result, downloader, profiler, start)
+    return result
+
+
+def collect_download_stats(
+    result: EpubDownloadResult,
+    downloader: EpubFileDownloader,
+    profiler: Profiler,
+    start: float,
+) -> None:
+    result.files = downloader.file_outcomes
+    result.images_bytes_saved = downloader.images_bytes_saved
+    result.timings = dict(profiler.phase_timings)
+    result.total_time = time.perf_counter() - start
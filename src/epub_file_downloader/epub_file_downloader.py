@@ -1,24 +1,52 @@
 import os.path
+from dataclasses import dataclass
 from http import HTTPStatus
 from time import sleep
 import requests
 from bs4 import BeautifulSoup
-from requests import HTTPError
+from requests import RequestException
 from tqdm import tqdm
 
 from src.file_manager.file_manager import FileManager
+from src.image_optimizer.image_optimizer import ImageOptimizer
 from src.logster.logster import Logster
+from src.profiler.profiler import Profiler
 
 MAX_RETRIES = 3
 MAX_DELAY = 5
+REQUEST_TIMEOUT = 30
+
+
+@dataclass
+class FileOutcome:
+    path: str
+    success: bool
+    size: int = 0
+    error: str = None
 
 
 class EpubFileDownloader:
-    def __init__(self, logster: Logster, base_url: str, ebook_name: str):
+    def __init__(
+        self,
+        logster: Logster,
+        base_url: str,
+        ebook_name: str,
+        profiler: Profiler = None,
+        image_optimizer: ImageOptimizer = None,
+        file_manager: FileManager = None,
+        show_progress: bool = True,
+    ):
         self.logster: Logster = logster
+        self.profiler: Profiler = profiler or Profiler(logster, enabled=False)
+        self.image_optimizer: ImageOptimizer = image_optimizer
         self.base_url: str = base_url
         self.ebook_name: str = ebook_name
-        self.file_manager: str = FileManager(logster, ebook_name)
+        self.file_manager: FileManager = file_manager or FileManager(
+            logster, ebook_name
+        )
+        self.show_progress: bool = show_progress
+        self.file_outcomes: list[FileOutcome] = []
+        self.images_bytes_saved: int = None
         self.retry_codes: list[int] = [
             HTTPStatus.TOO_MANY_REQUESTS,
             HTTPStatus.INTERNAL_SERVER_ERROR,
@@ -29,28 +57,36 @@ class EpubFileDownloader:
 
     def download_file(self, path) -> bool:
         url: str = f"{self.base_url}/{path}"
+        error: str = None
         for attempt in range(MAX_RETRIES):
             try:
                 self.logster.log(
                     f"Fetching URL: {url} (Attempt {attempt + 1}/{MAX_RETRIES})"
                 )
-                response = requests.get(url)
+                response = requests.get(url, timeout=REQUEST_TIMEOUT)
                 response.raise_for_status()
                 if response.content is None:
+                    self.file_outcomes.append(
+                        FileOutcome(path, False, error="Empty response")
+                    )
                     return False
                 self.file_manager.save_content_to_file(response.content, path)
+                self.file_outcomes.append(
+                    FileOutcome(path, True, len(response.content))
+                )
                 return True
-            except HTTPError as e:
+            except RequestException as e:
+                error = str(e)
                 self.logster.log(
                     f"Failed to fetch: {url}, Attempt {attempt + 1}/{MAX_RETRIES}, Error: {e}"
                 )
-                code = e.response.status_code
-                if code in self.retry_codes:
+                if e.response is None or e.response.status_code in self.retry_codes:
                     sleep(MAX_DELAY)
                     continue
         self.logster.log(
             f"Giving up on fetching URL: {url} after {MAX_RETRIES} attempts."
         )
+        self.file_outcomes.append(FileOutcome(path, False, error=error))
         return False
 
     def extract_content_opf_path_from_xml(self, container_xml_path: str) -> str:
@@ -90,32 +126,51 @@ class EpubFileDownloader:
 
     def download_all_files(self, file_paths: list[str]) -> None:
         for path in tqdm(
-            file_paths, desc="Fetching files", disable=self.logster.verbose
+            file_paths,
+            desc="Fetching files",
+            disable=self.logster.verbose or not self.show_progress,
         ):
             self.download_file(path)
 
     def download_epub_files(self) -> None:
         self.logster.log("---- Creating mimetype file...")
-        self.file_manager.save_content_to_file(b"application/epub+zip", "mimetype")
+        with self.profiler.phase("create mimetype"):
+            self.file_manager.save_content_to_file(b"application/epub+zip", "mimetype")
 
         self.logster.log("---- Downloading container.xml file...")
         container_xml_path = "META-INF/container.xml"
-        self.download_file(container_xml_path)
+        with self.profiler.phase("download container.xml"):
+            self.download_file(container_xml_path)
 
         self.logster.log("---- Extracting content.opf path from container.xml...")
-        content_opf_path = self.extract_content_opf_path_from_xml(container_xml_path)
+        with self.profiler.phase("parse container.xml"):
+            content_opf_path = self.extract_content_opf_path_from_xml(
+                container_xml_path
+            )
 
         self.logster.log("---- Downloading content.opf file...")
-        self.download_file(content_opf_path)
+        with self.profiler.phase("download content.opf"):
+            self.download_file(content_opf_path)
 
         self.logster.log("---- Getting file list from content.opf...")
-        file_paths = self.get_file_paths_from_content_opf(content_opf_path)
+        with self.profiler.phase("parse content.opf"):
+            file_paths = self.get_file_paths_from_content_opf(content_opf_path)
 
         self.logster.log("---- Downloading files...")
-        self.download_all_files(file_paths)
+        with self.profiler.phase("download files"):
+            self.download_all_files(file_paths)
+
+        if self.image_optimizer is not None:
+            self.logster.log("---- Optimizing images...")
+            with self.profiler.phase("optimize images"):
+                self.images_bytes_saved = self.image_optimizer.optimize_images(
+                    self.file_manager, content_opf_path
+                )
 
         self.logster.log("---- Creating EPUB archive...")
-        self.file_manager.create_epub_archive()
+        with self.profiler.phase("create archive"):
+            self.file_manager.create_epub_archive()
 
         self.logster.log("---- Deleting temporary files...")
-        self.file_manager.cleanup_epub_file_directory()
+        with self.profiler.phase("cleanup"):
+            self.file_manager.cleanup_epub_file_directory()
@@ -8,14 +8,24 @@ OUTPUT_DIR = "downloaded_epubs"
 
 
 class FileManager:
-    def __init__(self, logster: Logster, ebook_name: str):
+    def __init__(
+        self,
+        logster: Logster,
+        ebook_name: str,
+        output_dir: str = OUTPUT_DIR,
+        epub_target=None,
+    ):
         self.logster: Logster = logster
         self.ebook_name: str = ebook_name
-        self.output_directory: str = os.path.join(OUTPUT_DIR, self.ebook_name)
+        self.output_dir: str = output_dir
+        self.output_directory: str = os.path.join(output_dir, self.ebook_name)
+        self.epub_target = epub_target
+        if self.epub_target is None:
+            self.epub_target = os.path.join(output_dir, f"{self.ebook_name}.epub")
         self.setup_directories()
 
     def setup_directories(self) -> None:
-        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        os.makedirs(self.output_dir, exist_ok=True)
         os.makedirs(self.output_directory, exist_ok=True)
 
     def save_content_to_file(self, content, path: str) -> None:
@@ -36,10 +46,14 @@ class FileManager:
         return acc
 
     def create_epub_archive(self) -> None:
-        epub_path: str = os.path.join(OUTPUT_DIR, f"{self.ebook_name}.epub")
+        if isinstance(self.epub_target, (str, os.PathLike)):
+            epub_path: str = os.fspath(self.epub_target)
+            os.makedirs(os.path.dirname(epub_path) or ".", exist_ok=True)
+        else:
+            epub_path: str = "output stream"
 
         self.logster.log(f"Creating EPUB at: {epub_path}")
-        with zipfile.ZipFile(epub_path, "w", allowZip64=True) as epub:
+        with zipfile.ZipFile(self.epub_target, "w", allowZip64=True) as epub:
             epub.write(
                 os.path.join(self.output_directory, "mimetype"),
                 "mimetype",
@@ -0,0 +1,178 @@
+import io
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from bs4 import BeautifulSoup
+
+from src.file_manager.file_manager import FileManager
+from src.logster.logster import Logster
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+DEFAULT_MAX_PIXELS = 2_000_000
+DEFAULT_JPEG_QUALITY = 85
+MAX_JPEG_QUALITY = 95
+OPTIMIZABLE_MEDIA_TYPES = {
+    "image/jpeg": "JPEG",
+    "image/png": "PNG",
+}
+SVG_MEDIA_TYPE = "image/svg+xml"
+
+
+def optimize_image(
+    local_path: str, image_format: str, max_pixels: int, jpeg_quality: int
+) -> tuple[int, int, float]:
+    cpu_start: float = time.process_time()
+    with open(local_path, "rb") as file:
+        original: bytes = file.read()
+
+    with Image.open(io.BytesIO(original)) as image:
+        image.load()
+        icc_profile: bytes = image.info.get("icc_profile")
+        image = ImageOps.exif_transpose(image)
+        exif = image.getexif()
+        width, height = image.size
+        if width * height > max_pixels:
+            scale: float = math.sqrt(max_pixels / (width * height))
+            new_size = (max(1, int(width * scale)), max(1, int(height * scale)))
+            image = image.resize(new_size, Image.Resampling.LANCZOS)
+
+        save_options: dict = {"optimize": True}
+        if icc_profile:
+            save_options["icc_profile"] = icc_profile
+        if len(exif):
+            save_options["exif"] = exif
+
+        buffer = io.BytesIO()
+        if image_format == "JPEG":
+            if image.mode not in ("RGB", "L", "CMYK"):
+                image = image.convert("RGB")
+            image.save(
+                buffer, "JPEG", quality=jpeg_quality, progressive=True, **save_options
+            )
+        else:
+            image.save(buffer, "PNG", **save_options)
+        optimized: bytes = buffer.getvalue()
+
+    if len(optimized) >= len(original):
+        return len(original), len(original), time.process_time() - cpu_start
+
+    with open(local_path, "wb") as file:
+        file.write(optimized)
+    return len(original), len(optimized), time.process_time() - cpu_start
+
+
+class ImageOptimizer:
+    def __init__(
+        self,
+        logster: Logster,
+        max_pixels: int = DEFAULT_MAX_PIXELS,
+        jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+        include_cover: bool = False,
+        max_workers: int = None,
+    ):
+        if Image is None:
+            raise RuntimeError(
+                "Image optimization requires Pillow: pip install Pillow"
+            )
+        if max_pixels <= 0:
+            raise ValueError(f"max_pixels must be greater than 0, got {max_pixels}")
+        if not 1 <= jpeg_quality <= MAX_JPEG_QUALITY:
+            raise ValueError(
+                f"jpeg_quality must be between 1 and {MAX_JPEG_QUALITY}, got {jpeg_quality}"
+            )
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError(f"max_workers must be greater than 0, got {max_workers}")
+        self.logster: Logster = logster
+        self.max_pixels: int = max_pixels
+        self.jpeg_quality: int = jpeg_quality
+        self.include_cover: bool = include_cover
+        self.max_workers: int = max_workers
+
+    def get_image_items_from_content_opf(
+        self, file_manager: FileManager, content_opf_path: str
+    ) -> list[tuple[str, str]]:
+        local_path: str = file_manager.get_local_file_path(content_opf_path)
+        with open(local_path, "r", encoding="utf-8") as file:
+            soup = BeautifulSoup(file.read(), "xml")
+
+        cover_ids: set[str] = set()
+        for meta in soup.find_all("meta", attrs={"name": "cover"}):
+            if meta.get("content"):
+                cover_ids.add(meta["content"])
+
+        subdirectory: str = os.path.dirname(content_opf_path)
+        image_items: list[tuple[str, str]] = []
+        for item in soup.find_all("item"):
+            media_type: str = item.get("media-type", "")
+            href: str = item.get("href")
+            if not href or not media_type.startswith("image/"):
+                continue
+            if media_type == SVG_MEDIA_TYPE:
+                self.logster.log(f"Skipping SVG image: {href}")
+                continue
+            if media_type not in OPTIMIZABLE_MEDIA_TYPES:
+                self.logster.log(f"Skipping unsupported image type {media_type}: {href}")
+                continue
+            is_cover: bool = item.get("id") in cover_ids or "cover-image" in item.get(
+                "properties", ""
+            ).split()
+            if is_cover and not self.include_cover:
+                self.logster.log(f"Skipping cover image: {href}")
+                continue
+            path: str = f"{subdirectory}/{href}" if subdirectory else href
+            image_items.append((path, OPTIMIZABLE_MEDIA_TYPES[media_type]))
+        return image_items
+
+    def optimize_images(self, file_manager: FileManager, content_opf_path: str) -> int:
+        image_items = self.get_image_items_from_content_opf(
+            file_manager, content_opf_path
+        )
+        jobs: list[tuple[str, str]] = []
+        for path, image_format in image_items:
+            local_path: str = file_manager.get_local_file_path(path)
+            if os.path.isfile(local_path):
+                jobs.append((local_path, image_format))
+
+        start: float = time.perf_counter()
+        original_total: int = 0
+        optimized_total: int = 0
+        cpu_total: float = 0.0
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(
+                    optimize_image,
+                    local_path,
+                    image_format,
+                    self.max_pixels,
+                    self.jpeg_quality,
+                ): local_path
+                for local_path, image_format in jobs
+            }
+            for future, local_path in futures.items():
+                try:
+                    original_size, optimized_size, cpu_time = future.result()
+                except Exception as e:
+                    self.logster.log(f"Failed to optimize image {local_path}: {e}")
+                    continue
+                self.logster.log(
+                    f"Optimized {local_path}: {original_size} -> {optimized_size} bytes"
+                )
+                original_total += original_size
+                optimized_total += optimized_size
+                cpu_total += cpu_time
+
+        bytes_saved: int = original_total - optimized_total
+        self.logster.log(
+            f"Image optimization for {file_manager.ebook_name}: {len(jobs)} images, "
+            f"{original_total} -> {optimized_total} bytes "
+            f"(saved {bytes_saved} bytes) using {cpu_total:.2f}s of worker CPU "
+            f"in {time.perf_counter() - start:.2f}s",
+            override_verbose=True,
+        )
+        return bytes_saved
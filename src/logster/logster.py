@@ -1,7 +1,14 @@
+import sys
+
+
 class Logster:
-    def __init__(self, verbose):
+    def __init__(self, verbose, stream=None, quiet=False):
         self.verbose = verbose
+        self.stream = stream
+        self.quiet = quiet
 
     def log(self, message, override_verbose=False):
+        if self.quiet:
+            return
         if self.verbose or override_verbose:
-            print(message)
+            print(message, file=self.stream or sys.stdout)
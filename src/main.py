@@ -11,9 +11,15 @@ def adjust_sys_path():
 
 adjust_sys_path()
 
-from src.epub_file_downloader.epub_file_downloader import EpubFileDownloader
-from src.epub_locator.epub_locator import EpubLocator
+from src.epub_api.epub_api import EpubDownloadError, download_epub
+from src.file_manager.file_manager import OUTPUT_DIR
+from src.image_optimizer.image_optimizer import (
+    DEFAULT_JPEG_QUALITY,
+    DEFAULT_MAX_PIXELS,
+    ImageOptimizer,
+)
 from src.logster.logster import Logster
+from src.profiler.profiler import Profiler
 
 
 def get_args():
@@ -24,21 +30,74 @@ def get_args():
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Enable verbose output"
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile CPU time and memory per phase and write a report to the output directory",
+    )
+    parser.add_argument(
+        "--optimize-images",
+        action="store_true",
+        help="Downscale and recompress JPEG/PNG images before creating the EPUB (requires Pillow)",
+    )
+    parser.add_argument(
+        "--max-image-pixels",
+        type=int,
+        default=DEFAULT_MAX_PIXELS,
+        help=f"Downscale images larger than this many pixels (default: {DEFAULT_MAX_PIXELS})",
+    )
+    parser.add_argument(
+        "--jpeg-quality",
+        type=int,
+        default=DEFAULT_JPEG_QUALITY,
+        help=f"JPEG quality (1-95) used when recompressing images (default: {DEFAULT_JPEG_QUALITY})",
+    )
+    parser.add_argument(
+        "--optimize-cover",
+        action="store_true",
+        help="Also optimize the cover image",
+    )
+    parser.add_argument(
+        "--image-workers",
+        type=int,
+        default=None,
+        help="Number of processes used to optimize images (default: CPU count)",
+    )
     return parser.parse_args()
 
 
 def main():
     args = get_args()
 
+    logger = Logster(args.verbose)
+    profiler = Profiler(logger, args.profile)
+    ebook_name = "unknown_ebook"
     try:
-        logger = Logster(args.verbose)
-        locator = EpubLocator(logger, args.book_url.rstrip('/'))
-        base_url = locator.get_epub_base_url()
-        ebook_name = locator.get_ebook_name()
-        downloader = EpubFileDownloader(logger, base_url, ebook_name)
-        downloader.download_epub_files()
+        image_optimizer = None
+        if args.optimize_images:
+            image_optimizer = ImageOptimizer(
+                logger,
+                max_pixels=args.max_image_pixels,
+                jpeg_quality=args.jpeg_quality,
+                include_cover=args.optimize_cover,
+                max_workers=args.image_workers,
+            )
+        result = download_epub(
+            args.book_url,
+            OUTPUT_DIR,
+            logster=logger,
+            profiler=profiler,
+            image_optimizer=image_optimizer,
+            show_progress=True,
+        )
+        ebook_name = result.ebook_name
+    except EpubDownloadError as e:
+        ebook_name = e.result.ebook_name or ebook_name
+        logger.log(f"Failed to create EPUB: {e}", override_verbose=True)
     except Exception as e:
         logger.log(f"Failed to create EPUB: {e}", override_verbose=True)
+    finally:
+        profiler.write_report(OUTPUT_DIR, ebook_name)
 
 
 if __name__ == "__main__":
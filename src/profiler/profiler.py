@@ -0,0 +1,159 @@
+import cProfile
+import io
+import os
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from src.logster.logster import Logster
+
+TOP_FUNCTIONS = 25
+TOP_ALLOCATIONS = 15
+
+
+class Profiler:
+    def __init__(self, logster: Logster, enabled: bool):
+        self.logster: Logster = logster
+        self.enabled: bool = enabled
+        self.phase_names: list[str] = []
+        self.phase_timings: dict[str, float] = {}
+        self.phase_profiles: dict[str, cProfile.Profile] = {}
+        self.phase_peak_memory: dict[str, int] = {}
+        self.phase_allocations: dict[str, list[tracemalloc.StatisticDiff]] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        if name not in self.phase_names:
+            self.phase_names.append(name)
+        if not self.enabled:
+            start: float = time.perf_counter()
+            try:
+                yield
+            finally:
+                self._add_timing(name, time.perf_counter() - start)
+            return
+
+        started_tracing: bool = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        # Leave the peak of a tracer that was already running untouched: the
+        # phase peak is then only known if the phase pushed it higher, and
+        # falls back to the memory traced at the start or end of the phase.
+        memory_before, peak_before = tracemalloc.get_traced_memory()
+        snapshot_before = tracemalloc.take_snapshot()
+        profile: cProfile.Profile = self.phase_profiles.setdefault(
+            name, cProfile.Profile()
+        )
+        start = time.perf_counter()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._add_timing(name, time.perf_counter() - start)
+            memory_after, peak = tracemalloc.get_traced_memory()
+            if not started_tracing and peak <= peak_before:
+                peak = max(memory_before, memory_after)
+            self.phase_peak_memory[name] = max(
+                peak, self.phase_peak_memory.get(name, 0)
+            )
+            snapshot_after = tracemalloc.take_snapshot()
+            if started_tracing:
+                tracemalloc.stop()
+            allocations = self._filter_snapshot(snapshot_after).compare_to(
+                self._filter_snapshot(snapshot_before), "lineno"
+            )
+            self.phase_allocations[name] = self._merge_allocations(
+                self.phase_allocations.get(name, []), allocations
+            )
+
+    def _add_timing(self, name: str, elapsed: float) -> None:
+        self.phase_timings[name] = self.phase_timings.get(name, 0.0) + elapsed
+
+    @staticmethod
+    def _merge_allocations(
+        previous: list[tracemalloc.StatisticDiff],
+        current: list[tracemalloc.StatisticDiff],
+    ) -> list[tracemalloc.StatisticDiff]:
+        merged: dict[tracemalloc.Traceback, tracemalloc.StatisticDiff] = {}
+        for stat in previous + current:
+            if stat.traceback not in merged:
+                merged[stat.traceback] = stat
+                continue
+            earlier = merged[stat.traceback]
+            merged[stat.traceback] = tracemalloc.StatisticDiff(
+                stat.traceback,
+                stat.size,
+                earlier.size_diff + stat.size_diff,
+                stat.count,
+                earlier.count_diff + stat.count_diff,
+            )
+        return sorted(
+            merged.values(),
+            key=lambda stat: (abs(stat.size_diff), stat.size),
+            reverse=True,
+        )
+
+    @staticmethod
+    def _filter_snapshot(snapshot: tracemalloc.Snapshot) -> tracemalloc.Snapshot:
+        return snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, cProfile.__file__),
+                tracemalloc.Filter(False, __file__),
+            ]
+        )
+
+    def get_peak_memory(self) -> int:
+        return max(self.phase_peak_memory.values(), default=0)
+
+    def get_combined_stats(self) -> pstats.Stats:
+        profiles: list[cProfile.Profile] = list(self.phase_profiles.values())
+        if not profiles:
+            raise RuntimeError("No profiled phases to report on.")
+        return pstats.Stats(*profiles)
+
+    def build_report(self, ebook_name: str) -> str:
+        report = io.StringIO()
+        report.write(f"==== Profile report for {ebook_name} ====\n")
+        report.write(f"Peak traced memory: {_format_bytes(self.get_peak_memory())}\n\n")
+
+        report.write(f"{'Phase':<40}{'Time (s)':>12}{'Peak memory':>16}\n")
+        for name in self.phase_names:
+            report.write(
+                f"{name:<40}{self.phase_timings.get(name, 0.0):>12.3f}"
+                f"{_format_bytes(self.phase_peak_memory.get(name, 0)):>16}\n"
+            )
+
+        for name in self.phase_names:
+            if name not in self.phase_profiles:
+                continue
+            report.write(f"\n---- Phase: {name}\n")
+            report.write(f"Top {TOP_FUNCTIONS} functions by cumulative time:\n")
+            stats = pstats.Stats(self.phase_profiles[name], stream=report)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+
+            report.write(f"Top {TOP_ALLOCATIONS} allocation sites (retained):\n")
+            for stat in self.phase_allocations.get(name, [])[:TOP_ALLOCATIONS]:
+                report.write(f"  {stat}\n")
+        return report.getvalue()
+
+    def write_report(self, directory: str, ebook_name: str) -> None:
+        if not self.enabled or not self.phase_profiles:
+            return
+
+        os.makedirs(directory, exist_ok=True)
+        report_path: str = os.path.join(directory, f"{ebook_name}.profile.txt")
+        stats_path: str = os.path.join(directory, f"{ebook_name}.prof")
+
+        with open(report_path, "w", encoding="utf-8") as file:
+            file.write(self.build_report(ebook_name))
+        self.get_combined_stats().dump_stats(stats_path)
+
+        self.logster.log(f"Profile report written to: {report_path}", override_verbose=True)
+        self.logster.log(f"Profile stats (pstats) written to: {stats_path}", override_verbose=True)
+
+
+def _format_bytes(size: int) -> str:
+    return f"{size / (1024 * 1024):.2f} MiB"
@@ -0,0 +1,179 @@
+import io
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import patch, Mock
+
+from requests import HTTPError
+
+from src.epub_api.epub_api import EpubDownloadError, download_epub
+
+TEST_OUTPUT_DIR = "test_api_output"
+
+
+class UnseekableWriter(io.RawIOBase):
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.buffer.extend(data)
+        return len(data)
+
+
+class TestEpubApi(unittest.TestCase):
+    def setUp(self):
+        self.book_url = "http://example.com/books/test_ebook.epub"
+        self.remote_files = {
+            f"{self.book_url}/META-INF/container.xml": b'''
+                <container xmlns="urn:oasis:names:tc:opendocument:xmlns:container" version="1.0">
+                <rootfiles>
+                <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+                </rootfiles>
+                </container>
+            ''',
+            f"{self.book_url}/OEBPS/content.opf": b'''
+                <package xmlns="http://www.idpf.org/2007/opf" version="2.0">
+                <manifest>
+                <item id="chapter" href="chapter.xhtml" media-type="application/xhtml+xml"/>
+                <item id="missing" href="missing.xhtml" media-type="application/xhtml+xml"/>
+                </manifest>
+                </package>
+            ''',
+            f"{self.book_url}/OEBPS/chapter.xhtml": b"<html><body>Chapter</body></html>",
+        }
+        if os.path.exists(TEST_OUTPUT_DIR):
+            shutil.rmtree(TEST_OUTPUT_DIR)
+
+    def mock_requests_get(self, url, **kwargs):
+        mock_response = Mock()
+        if url in self.remote_files:
+            mock_response.status_code = 200
+            mock_response.content = self.remote_files[url]
+        else:
+            mock_response.status_code = 404
+            mock_response.raise_for_status.side_effect = HTTPError(
+                f"404 Client Error for url: {url}", response=mock_response)
+        return mock_response
+
+    def assert_valid_epub(self, epub):
+        with zipfile.ZipFile(epub) as archive:
+            self.assertEqual("mimetype", archive.namelist()[0])
+            self.assertEqual(b"application/epub+zip", archive.read("mimetype"))
+            self.assertEqual(b"<html><body>Chapter</body></html>", archive.read("OEBPS/chapter.xhtml"))
+
+    @patch('src.epub_file_downloader.epub_file_downloader.requests.get')
+    def test_should_return_epub_bytes_given_no_output(self, mock_get):
+        mock_get.side_effect = self.mock_requests_get
+        original_cwd = os.getcwd()
+
+        with tempfile.TemporaryDirectory() as working_dir:
+            os.chdir(working_dir)
+            try:
+                result = download_epub(self.book_url)
+                self.assertEqual([], os.listdir(working_dir))
+            finally:
+                os.chdir(original_cwd)
+
+        self.assertEqual("test_ebook", result.ebook_name)
+        self.assertIsNone(result.output_path)
+        self.assert_valid_epub(io.BytesIO(result.content))
+
+    @patch('src.epub_file_downloader.epub_file_downloader.requests.get')
+    def test_should_report_per_file_outcomes_and_timings(self, mock_get):
+        mock_get.side_effect = self.mock_requests_get
+
+        result = download_epub(self.book_url)
+
+        outcomes = {outcome.path: outcome for outcome in result.files}
+        self.assertTrue(outcomes["OEBPS/chapter.xhtml"].success)
+        self.assertEqual(len(self.remote_files[f"{self.book_url}/OEBPS/chapter.xhtml"]),
+                         outcomes["OEBPS/chapter.xhtml"].size)
+        self.assertEqual(["OEBPS/missing.xhtml"], [outcome.path for outcome in result.failed_files])
+        self.assertIn("404", result.failed_files[0].error)
+        self.assertIn("locate epub", result.timings)
+        self.assertIn("download files", result.timings)
+        self.assertGreaterEqual(result.total_time, sum(result.timings.values()))
+
+    @patch('src.epub_file_downloader.epub_file_downloader.requests.get')
+    def test_should_raise_error_with_partial_result_when_download_fails(self, mock_get):
+        del self.remote_files[f"{self.book_url}/OEBPS/content.opf"]
+        mock_get.side_effect = self.mock_requests_get
+
+        with self.assertRaises(EpubDownloadError) as context:
+            download_epub(self.book_url)
+
+        result = context.exception.result
+        self.assertEqual("test_ebook", result.ebook_name)
+        self.assertEqual(["OEBPS/content.opf"], [outcome.path for outcome in result.failed_files])
+        self.assertIn("locate epub", result.timings)
+
+    @patch('src.epub_api.epub_api.EpubLocator')
+    def test_should_raise_error_without_ebook_name_when_locating_fails(self, mock_locator):
+        mock_locator.return_value.get_epub_base_url.side_effect = RuntimeError("Failed to find the 'Read Online' link.")
+
+        with self.assertRaises(EpubDownloadError) as context:
+            download_epub(self.book_url)
+
+        self.assertIn("Read Online", str(context.exception))
+        self.assertIsNone(context.exception.result.ebook_name)
+        self.assertEqual([], context.exception.result.files)
+        self.assertIn("locate epub", context.exception.result.timings)
+
+    @patch('src.epub_file_downloader.epub_file_downloader.requests.get')
+    def test_should_write_epub_to_given_stream(self, mock_get):
+        mock_get.side_effect = self.mock_requests_get
+        stream = io.BytesIO()
+
+        result = download_epub(self.book_url, stream)
+
+        self.assertIsNone(result.content)
+        self.assert_valid_epub(stream)
+
+    @patch('src.epub_file_downloader.epub_file_downloader.requests.get')
+    def test_should_write_epub_without_data_descriptors_given_unseekable_stream(self, mock_get):
+        mock_get.side_effect = self.mock_requests_get
+        stream = UnseekableWriter()
+
+        download_epub(self.book_url, stream)
+
+        content = bytes(stream.buffer)
+        self.assertEqual(b"PK\x03\x04", content[:4])
+        flags, = struct.unpack("<H", content[6:8])
+        self.assertEqual(0, flags & 0x08, "mimetype entry should not use a data descriptor.")
+        self.assertEqual(b"mimetype", content[30:38])
+        self.assert_valid_epub(io.BytesIO(content))
+
+    @patch('src.epub_file_downloader.epub_file_downloader.requests.get')
+    def test_should_write_epub_named_after_ebook_given_directory(self, mock_get):
+        mock_get.side_effect = self.mock_requests_get
+
+        result = download_epub(self.book_url, TEST_OUTPUT_DIR)
+
+        expected_path = os.path.join(TEST_OUTPUT_DIR, "test_ebook.epub")
+        self.assertEqual(expected_path, result.output_path)
+        self.assertEqual(["test_ebook.epub"], os.listdir(TEST_OUTPUT_DIR))
+        self.assert_valid_epub(expected_path)
+
+    @patch('src.epub_file_downloader.epub_file_downloader.requests.get')
+    def test_should_write_epub_to_given_file_path(self, mock_get):
+        mock_get.side_effect = self.mock_requests_get
+        epub_path = os.path.join(TEST_OUTPUT_DIR, "custom.epub")
+
+        result = download_epub(self.book_url, epub_path)
+
+        self.assertEqual(epub_path, result.output_path)
+        self.assert_valid_epub(epub_path)
+
+    def tearDown(self):
+        if os.path.exists(TEST_OUTPUT_DIR):
+            shutil.rmtree(TEST_OUTPUT_DIR)
+
+
+if __name__ == '__main__':
+    unittest.main()
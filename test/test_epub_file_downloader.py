@@ -2,6 +2,8 @@ import os
 import shutil
 import unittest
 from unittest.mock import patch, Mock
+
+from requests import ConnectionError
 from src.epub_file_downloader.epub_file_downloader import EpubFileDownloader
 from src.file_manager.file_manager import OUTPUT_DIR
 from src.logster.logster import Logster
@@ -66,6 +68,22 @@ class TestEbookDownloader(unittest.TestCase):
             content = file.read()
             self.assertEqual(content, b"Test file content")
 
+    @patch('src.epub_file_downloader.epub_file_downloader.sleep')
+    @patch('requests.get')
+    def test_should_record_failed_outcome_given_connection_error(self, mock_get, mock_sleep):
+        mock_get.side_effect = ConnectionError("Connection refused")
+
+        result = self.downloader.download_file(self.file_path)
+
+        self.assertFalse(result)
+        self.assertEqual(3, mock_get.call_count)
+        self.assertIsNotNone(mock_get.call_args.kwargs.get('timeout'))
+        self.assertEqual(1, len(self.downloader.file_outcomes))
+        outcome = self.downloader.file_outcomes[0]
+        self.assertEqual(self.file_path, outcome.path)
+        self.assertFalse(outcome.success)
+        self.assertIn("Connection refused", outcome.error)
+
     def test_should_successfully_extract_opf_path_from_xml(self):
         os.makedirs(OUTPUT_DIR, exist_ok=True)
         os.makedirs(self.test_output_dir, exist_ok=True)
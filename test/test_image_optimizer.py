@@ -0,0 +1,114 @@
+import os
+import shutil
+import unittest
+
+from src.file_manager.file_manager import FileManager, OUTPUT_DIR
+from src.image_optimizer.image_optimizer import ImageOptimizer, optimize_image
+from src.logster.logster import Logster
+
+try:
+    from PIL import Image, ImageCms
+except ImportError:
+    Image = None
+
+
+@unittest.skipIf(Image is None, "Pillow is not installed")
+class TestImageOptimizer(unittest.TestCase):
+    def setUp(self):
+        self.ebook_name = 'test_ebook'
+        if os.path.exists(OUTPUT_DIR):
+            shutil.rmtree(OUTPUT_DIR)
+        self.file_manager = FileManager(Logster(verbose=False), self.ebook_name)
+        self.optimizer = ImageOptimizer(Logster(verbose=False), max_pixels=100 * 100, max_workers=1)
+
+        self.content_opf_path = "OEBPS/content.opf"
+        self.content_opf = '''<?xml version="1.0" encoding="utf-8"?>
+            <package xmlns="http://www.idpf.org/2007/opf" version="2.0">
+            <metadata><meta name="cover" content="cover-img"/></metadata>
+            <manifest>
+            <item id="cover-img" href="images/cover.jpg" media-type="image/jpeg"/>
+            <item id="photo" href="images/photo.jpg" media-type="image/jpeg"/>
+            <item id="diagram" href="images/diagram.png" media-type="image/png"/>
+            <item id="vector" href="images/vector.svg" media-type="image/svg+xml"/>
+            <item id="chapter" href="chapter.xhtml" media-type="application/xhtml+xml"/>
+            </manifest>
+            </package>
+        '''
+        self.file_manager.save_content_to_file(self.content_opf.encode('utf-8'), self.content_opf_path)
+        self._save_image("OEBPS/images/cover.jpg", "JPEG")
+        self._save_image("OEBPS/images/photo.jpg", "JPEG")
+        self._save_image("OEBPS/images/diagram.png", "PNG")
+
+    def _save_image(self, path, image_format):
+        local_path = self.file_manager.get_local_file_path(path)
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        image = Image.effect_noise((400, 300), 64).convert("RGB")
+        image.save(local_path, image_format, quality=100)
+
+    def test_should_skip_cover_and_svg_images_by_default(self):
+        result = self.optimizer.get_image_items_from_content_opf(self.file_manager, self.content_opf_path)
+
+        expected_items = [("OEBPS/images/photo.jpg", "JPEG"), ("OEBPS/images/diagram.png", "PNG")]
+        self.assertEqual(expected_items, result)
+
+    def test_should_include_cover_image_when_requested(self):
+        optimizer = ImageOptimizer(Logster(verbose=False), include_cover=True)
+
+        result = optimizer.get_image_items_from_content_opf(self.file_manager, self.content_opf_path)
+
+        self.assertIn(("OEBPS/images/cover.jpg", "JPEG"), result)
+
+    def test_should_downscale_images_in_place_and_report_bytes_saved(self):
+        photo_path = self.file_manager.get_local_file_path("OEBPS/images/photo.jpg")
+        cover_path = self.file_manager.get_local_file_path("OEBPS/images/cover.jpg")
+        photo_size = os.path.getsize(photo_path)
+        cover_size = os.path.getsize(cover_path)
+
+        bytes_saved = self.optimizer.optimize_images(self.file_manager, self.content_opf_path)
+
+        self.assertGreater(bytes_saved, 0)
+        self.assertLess(os.path.getsize(photo_path), photo_size)
+        self.assertEqual(cover_size, os.path.getsize(cover_path))
+        with Image.open(photo_path) as photo:
+            self.assertEqual("JPEG", photo.format)
+            self.assertLessEqual(photo.width * photo.height, 100 * 100)
+        with Image.open(self.file_manager.get_local_file_path("OEBPS/images/diagram.png")) as diagram:
+            self.assertEqual("PNG", diagram.format)
+
+    def test_should_reject_invalid_pixel_budget_and_jpeg_quality(self):
+        for max_pixels in (0, -1):
+            with self.assertRaises(ValueError):
+                ImageOptimizer(Logster(verbose=False), max_pixels=max_pixels)
+        for jpeg_quality in (0, 96):
+            with self.assertRaises(ValueError):
+                ImageOptimizer(Logster(verbose=False), jpeg_quality=jpeg_quality)
+        for max_workers in (0, -1):
+            with self.assertRaises(ValueError):
+                ImageOptimizer(Logster(verbose=False), max_workers=max_workers)
+
+    def test_should_keep_icc_profile_and_exif_and_apply_orientation(self):
+        local_path = self.file_manager.get_local_file_path("OEBPS/images/photo.jpg")
+        icc_profile = ImageCms.ImageCmsProfile(ImageCms.createProfile("sRGB")).tobytes()
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        exif[0x010F] = "Test Camera"
+        image = Image.effect_noise((400, 300), 64).convert("RGB")
+        image.save(local_path, "JPEG", quality=100, icc_profile=icc_profile, exif=exif)
+
+        _, _, cpu_time = optimize_image(local_path, "JPEG", 100 * 100, 85)
+
+        self.assertGreater(cpu_time, 0)
+
+        with Image.open(local_path) as photo:
+            self.assertEqual(icc_profile, photo.info.get("icc_profile"))
+            self.assertLess(photo.width, photo.height)
+            self.assertNotIn(0x0112, photo.getexif())
+            self.assertEqual("Test Camera", photo.getexif()[0x010F])
+
+    def tearDown(self):
+        if os.path.exists(OUTPUT_DIR):
+            shutil.rmtree(OUTPUT_DIR)
+
+
+if __name__ == '__main__':
+    unittest.main()
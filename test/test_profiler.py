@@ -0,0 +1,117 @@
+import os
+import pstats
+import shutil
+import tracemalloc
+import unittest
+
+from src.logster.logster import Logster
+from src.profiler.profiler import Profiler
+
+TEST_REPORT_DIR = "test_profile_reports"
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        self.ebook_name = 'test_ebook'
+        if os.path.exists(TEST_REPORT_DIR):
+            shutil.rmtree(TEST_REPORT_DIR)
+
+    def test_should_only_record_timings_when_disabled(self):
+        profiler = Profiler(Logster(verbose=False), enabled=False)
+
+        with profiler.phase("phase one"):
+            sum(range(1000))
+
+        self.assertIn("phase one", profiler.phase_timings)
+        self.assertEqual({}, profiler.phase_profiles)
+        self.assertEqual(0, profiler.get_peak_memory())
+
+    def test_should_not_write_report_when_disabled(self):
+        profiler = Profiler(Logster(verbose=False), enabled=False)
+
+        with profiler.phase("phase one"):
+            sum(range(1000))
+        profiler.write_report(TEST_REPORT_DIR, self.ebook_name)
+
+        self.assertFalse(os.path.exists(TEST_REPORT_DIR))
+
+    def test_should_record_cpu_and_memory_per_phase_when_enabled(self):
+        profiler = Profiler(Logster(verbose=False), enabled=True)
+
+        with profiler.phase("allocate"):
+            data = [bytes(1024) for _ in range(1000)]
+        with profiler.phase("compute"):
+            sum(range(1000))
+
+        self.assertEqual(["allocate", "compute"], profiler.phase_names)
+        self.assertGreater(profiler.phase_peak_memory["allocate"], 1024 * 1000)
+        self.assertGreaterEqual(profiler.get_peak_memory(), profiler.phase_peak_memory["allocate"])
+        self.assertTrue(profiler.phase_allocations["allocate"])
+        del data
+
+    def test_should_merge_allocations_when_phase_repeats(self):
+        profiler = Profiler(Logster(verbose=False), enabled=True)
+        retained = []
+
+        for _ in range(2):
+            with profiler.phase("allocate"):
+                retained.append([bytes(1024) for _ in range(1000)])
+
+        largest = profiler.phase_allocations["allocate"][0]
+        self.assertGreater(largest.size_diff, 2 * 1024 * 1000)
+        self.assertEqual(1, len([stat for stat in profiler.phase_allocations["allocate"]
+                                 if stat.traceback == largest.traceback]))
+
+    def test_should_stop_tracing_memory_after_phase_when_it_started_it(self):
+        profiler = Profiler(Logster(verbose=False), enabled=True)
+
+        with profiler.phase("compute"):
+            self.assertTrue(tracemalloc.is_tracing())
+
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_should_keep_tracing_memory_after_phase_when_already_tracing(self):
+        profiler = Profiler(Logster(verbose=False), enabled=True)
+
+        tracemalloc.start()
+        try:
+            outer_allocation = bytes(4 * 1024 * 1024)
+            del outer_allocation
+            _, outer_peak = tracemalloc.get_traced_memory()
+
+            with profiler.phase("compute"):
+                sum(range(1000))
+
+            self.assertTrue(tracemalloc.is_tracing())
+            self.assertGreaterEqual(tracemalloc.get_traced_memory()[1], outer_peak)
+            self.assertLess(profiler.phase_peak_memory["compute"], outer_peak)
+        finally:
+            tracemalloc.stop()
+
+    def test_should_write_text_report_and_loadable_pstats_dump(self):
+        profiler = Profiler(Logster(verbose=False), enabled=True)
+
+        with profiler.phase("compute"):
+            sorted(range(1000), reverse=True)
+        profiler.write_report(TEST_REPORT_DIR, self.ebook_name)
+
+        report_path = os.path.join(TEST_REPORT_DIR, f"{self.ebook_name}.profile.txt")
+        stats_path = os.path.join(TEST_REPORT_DIR, f"{self.ebook_name}.prof")
+        self.assertTrue(os.path.isfile(report_path), f"{report_path} should be a file.")
+        self.assertTrue(os.path.isfile(stats_path), f"{stats_path} should be a file.")
+
+        with open(report_path, 'r', encoding='utf-8') as file:
+            report = file.read()
+        self.assertIn("Peak traced memory", report)
+        self.assertIn("---- Phase: compute", report)
+
+        stats = pstats.Stats(stats_path)
+        self.assertGreater(stats.total_calls, 0)
+
+    def tearDown(self):
+        if os.path.exists(TEST_REPORT_DIR):
+            shutil.rmtree(TEST_REPORT_DIR)
+
+
+if __name__ == '__main__':
+    unittest.main()